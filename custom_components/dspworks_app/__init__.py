@@ -19,6 +19,7 @@ from homeassistant.helpers import (
 )
 
 from .utils import Utils
+from .stats import DSPStatsStore
 from .const import *
 
 import logging, json
@@ -43,6 +44,11 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Inclusive(
                     CONF_CLIENT_SECRET, "oauth", default=OAUTH_CLIENT_SECRET
                 ): cv.string,
+                vol.Optional(CONF_POWER_CURVE, default=DEFAULT_POWER_CURVE): {
+                    vol.All(vol.Coerce(int), vol.Range(0, 100)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0)
+                    )
+                },
             }
         )
     },
@@ -51,6 +57,7 @@ CONFIG_SCHEMA = vol.Schema(
 
 PLATFORMS = [
     Platform.FAN,
+    Platform.SENSOR,
 ]
 
 
@@ -58,6 +65,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the DSPWorks component."""
     _LOGGER.debug("SETUP [START]: %s", json.dumps(config[DOMAIN]))
     hass.data[DOMAIN] = {}
+    hass.data[DOMAIN][CONF_POWER_CURVE] = config[DOMAIN][CONF_POWER_CURVE]
 
     config_flow.DSPWorksFlowHandler.async_register_implementation(
         hass,
@@ -86,6 +94,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     devices.update({device["device_id"]: device for device in response["devices"]})
     hass.data[DOMAIN][entry.entry_id]["devices"] = devices    
 
+    stats = DSPStatsStore(hass, entry.entry_id, hass.data[DOMAIN][CONF_POWER_CURVE])
+    await stats.async_load()
+    hass.data[DOMAIN][entry.entry_id]["stats"] = stats
+
     # Backwards compat
     if "auth_implementation" not in entry.data:
         hass.config_entries.async_update_entry(
@@ -118,6 +130,7 @@ async def config_entry_update_listener(hass: HomeAssistant, entry: ConfigEntry)
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        await hass.data[DOMAIN][entry.entry_id]["stats"].async_save()
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
@@ -20,3 +20,12 @@ SERVICE_SET_POWER_TRACKED_STATE = "set_switch_power_tracked_state"
 SERVICE_SET_LIGHT_POWER_TRACKED_STATE = "set_light_power_tracked_state"
 SERVICE_SET_LIGHT_BRIGHTNESS_TRACKED_STATE = "set_light_brightness_tracked_state"
 ATTR_POWER_STATE = "power_state"
+
+CONF_POWER_CURVE = "power_curve"
+# Estimated fan power draw in watts keyed by speed %, interpolated linearly
+DEFAULT_POWER_CURVE = {1: 4.0, 25: 8.0, 50: 14.0, 75: 21.0, 100: 28.0}
+
+STATS_STORAGE_VERSION = 1
+STATS_STORAGE_KEY = f"{DOMAIN}.stats"
+SIGNAL_STATS_UPDATED = f"{DOMAIN}_stats_updated_{{}}"
+SPEED_BANDS = {"low": (1, 33), "medium": (34, 66), "high": (67, 100)}
@@ -28,6 +28,7 @@ from homeassistant.util.percentage import (
 
 from .const import DEVICE_SET, DOMAIN, DOMAIN_API_URL, SERVICE_SET_FAN_SPEED_TRACKED_STATE
 from .entity import DSPEntity
+from .stats import DSPFanStats
 from .utils import DSPDevice, Utils
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,12 +42,13 @@ async def async_setup_entry(
     """Set up DSP fan devices."""
 
     devices = hass.data[DOMAIN][entry.entry_id]["devices"]
+    stats = hass.data[DOMAIN][entry.entry_id]["stats"]
     platform = entity_platform.async_get_current_platform()
 
     fans: list[Entity] = []
 
     for device in devices:
-        fans.append(DSPWorksFan(DSPDevice(device, devices[device])))
+        fans.append(DSPWorksFan(DSPDevice(device, devices[device]), stats.get(device)))
 
     platform.async_register_entity_service(
         SERVICE_SET_FAN_SPEED_TRACKED_STATE,
@@ -61,7 +63,7 @@ async def async_setup_entry(
 class DSPWorksFan(DSPEntity, FanEntity):
     """Representation of a DSP fan."""
 
-    def __init__(self, device: DSPDevice) -> None:
+    def __init__(self, device: DSPDevice, stats: DSPFanStats) -> None:
         """Create HA entity representing DSP fan."""
         #_LOGGER.debug("Fan HA Entity : %s", device)
         super().__init__(device)
@@ -69,11 +71,13 @@ class DSPWorksFan(DSPEntity, FanEntity):
         self._power: bool | None = None
         self._speed: int | None = None
         self._direction: int | None = None
+        self._stats = stats
 
     def _apply_state(self, state: dict) -> None:
         self._power = state.get("power")
         self._speed = state.get("speed")
         self._direction = state.get("direction")
+        self._stats.async_apply_state(state)
 
     @property
     def supported_features(self) -> int:
@@ -0,0 +1,134 @@
+"""Support for DSPWorks fan runtime and energy sensors."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ENERGY_KILO_WATT_HOUR, TIME_HOURS
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, SIGNAL_STATS_UPDATED, SPEED_BANDS
+from .stats import DSPFanStats
+from .utils import DSPDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class DSPStatsSensorEntityDescription(SensorEntityDescription):
+    """Describes a DSPWorks fan statistics sensor."""
+
+    value_fn: Callable[[DSPFanStats], float | int] = lambda stats: 0
+
+
+SENSOR_TYPES: tuple[DSPStatsSensorEntityDescription, ...] = (
+    DSPStatsSensorEntityDescription(
+        key="runtime",
+        name="Runtime",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=TIME_HOURS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda stats: round(stats.runtime_hours, 3),
+    ),
+    *(
+        DSPStatsSensorEntityDescription(
+            key=f"runtime_{band}",
+            name=f"Runtime {band.capitalize()} Speed",
+            icon="mdi:timer-outline",
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            native_unit_of_measurement=TIME_HOURS,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=lambda stats, band=band: round(stats.band_hours[band], 3),
+        )
+        for band in SPEED_BANDS
+    ),
+    DSPStatsSensorEntityDescription(
+        key="direction_changes",
+        name="Direction Changes",
+        icon="mdi:rotate-3d-variant",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda stats: stats.direction_changes,
+    ),
+    DSPStatsSensorEntityDescription(
+        key="energy",
+        name="Energy",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
+        value_fn=lambda stats: round(stats.energy_kwh, 3),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up DSP fan statistics sensors."""
+
+    devices = hass.data[DOMAIN][entry.entry_id]["devices"]
+    stats = hass.data[DOMAIN][entry.entry_id]["stats"]
+
+    sensors: list[DSPStatsSensor] = [
+        DSPStatsSensor(DSPDevice(device, devices[device]), stats.get(device), description)
+        for device in devices
+        for description in SENSOR_TYPES
+    ]
+
+    _LOGGER.debug("Sensor Entities Device : %s", sensors)
+    async_add_entities(sensors)
+
+
+class DSPStatsSensor(SensorEntity):
+    """Running total kept for a DSP fan, updated from its state changes."""
+
+    _attr_should_poll = False
+    entity_description: DSPStatsSensorEntityDescription
+
+    def __init__(
+        self,
+        device: DSPDevice,
+        stats: DSPFanStats,
+        description: DSPStatsSensorEntityDescription,
+    ) -> None:
+        """Create HA entity representing a DSP fan statistic."""
+        self.entity_description = description
+        self._device_id = device.device_id
+        self._stats = stats
+        self._attr_name = f"{device.name} {description.name}"
+        self._attr_unique_id = f"E-{self._device_id}-{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._device_id)},
+        )
+
+    @property
+    def native_value(self) -> float | int:
+        """Return the current total."""
+        return self.entity_description.value_fn(self._stats)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to statistics updates of the fan."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_STATS_UPDATED.format(self._device_id),
+                self.async_write_ha_state,
+            )
+        )
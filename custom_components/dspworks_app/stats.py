@@ -0,0 +1,166 @@
+"""Running runtime and energy aggregates for DSPWorks fans."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    SIGNAL_STATS_UPDATED,
+    SPEED_BANDS,
+    STATS_STORAGE_KEY,
+    STATS_STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Aggregates are only written to disk once this long after the last change
+_SAVE_DELAY = 60
+
+# Gaps between two states longer than this (e.g. cloud outages) are not
+# credited, as the fan state in between is unknown
+_MAX_GAP = timedelta(minutes=5)
+
+
+def power_at(power_curve: dict[int, float], speed: int) -> float:
+    """Return the estimated power draw in watts at a speed % from the curve."""
+    points = sorted(power_curve.items())
+    if not points:
+        return 0.0
+    if speed <= points[0][0]:
+        return points[0][1]
+    for (low_speed, low_watts), (high_speed, high_watts) in zip(points, points[1:]):
+        if speed <= high_speed:
+            ratio = (speed - low_speed) / (high_speed - low_speed)
+            return low_watts + ratio * (high_watts - low_watts)
+    return points[-1][1]
+
+
+def speed_band(speed: int) -> str | None:
+    """Return the name of the speed band a speed % falls in."""
+    for band, (low, high) in SPEED_BANDS.items():
+        if low <= speed <= high:
+            return band
+    return None
+
+
+class DSPFanStats:
+    """Runtime, direction and energy totals for a single fan."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        store: DSPStatsStore,
+        device_id: str,
+        power_curve: dict[int, float],
+        data: dict[str, Any] | None = None,
+    ) -> None:
+        """Create fan statistics, resuming from previously stored totals."""
+        data = data or {}
+        self.hass = hass
+        self.device_id = device_id
+        self._store = store
+        self._power_curve = power_curve
+        self.runtime_hours: float = data.get("runtime_hours", 0.0)
+        self.band_hours: dict[str, float] = {
+            band: data.get("band_hours", {}).get(band, 0.0) for band in SPEED_BANDS
+        }
+        self.direction_changes: int = data.get("direction_changes", 0)
+        self.energy_kwh: float = data.get("energy_kwh", 0.0)
+        self._last_state: dict | None = None
+        self._last_seen: datetime | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the totals in their stored form."""
+        return {
+            "runtime_hours": self.runtime_hours,
+            "band_hours": dict(self.band_hours),
+            "direction_changes": self.direction_changes,
+            "energy_kwh": self.energy_kwh,
+        }
+
+    @callback
+    def async_apply_state(self, state: dict) -> None:
+        """Credit the time since the previous state and record the new one."""
+        now = dt_util.utcnow()
+        previous, last_seen = self._last_state, self._last_seen
+        self._last_state, self._last_seen = state, now
+        if previous is None or last_seen is None:
+            return
+
+        changed = False
+        elapsed = now - last_seen
+        speed = previous.get("speed") or 0
+        if previous.get("power") and speed > 0 and elapsed <= _MAX_GAP:
+            hours = elapsed.total_seconds() / 3600
+            self.runtime_hours += hours
+            if (band := speed_band(speed)) is not None:
+                self.band_hours[band] += hours
+            self.energy_kwh += power_at(self._power_curve, speed) * hours / 1000
+            changed = True
+
+        direction = state.get("direction")
+        if direction is not None and previous.get("direction") not in (None, direction):
+            self.direction_changes += 1
+            changed = True
+
+        if changed:
+            self._store.async_schedule_save()
+            async_dispatcher_send(
+                self.hass, SIGNAL_STATS_UPDATED.format(self.device_id)
+            )
+
+
+class DSPStatsStore:
+    """Persist the fan statistics of a config entry."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, power_curve: dict[int, float]
+    ) -> None:
+        """Create the store for a config entry."""
+        self.hass = hass
+        self._power_curve = power_curve
+        self._store: Store = Store(
+            hass, STATS_STORAGE_VERSION, f"{STATS_STORAGE_KEY}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+        self._fans: dict[str, DSPFanStats] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored totals."""
+        self._data = await self._store.async_load() or {}
+        _LOGGER.debug("[STATS] LOADED %s", self._data)
+
+    def get(self, device_id: str) -> DSPFanStats:
+        """Return the statistics of a fan, creating them if needed."""
+        if device_id not in self._fans:
+            self._fans[device_id] = DSPFanStats(
+                self.hass,
+                self,
+                device_id,
+                self._power_curve,
+                self._data.get(device_id),
+            )
+        return self._fans[device_id]
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Write the totals to disk once changes have settled."""
+        self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Write the totals to disk now."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._data.update(
+            {device_id: stats.as_dict() for device_id, stats in self._fans.items()}
+        )
+        return self._data